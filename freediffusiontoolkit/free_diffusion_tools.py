@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from itertools import chain
 from pathlib import Path
 
 import numpy as np
@@ -6,13 +7,16 @@ from qspace.sampling import multishell as ms
 
 
 class FreeDiffusionTool:
+    # Option defaults, overridden by the keyword arguments passed on creation
+    default_options = {"newline": "\n"}
+
     def __init__(
         self,
         b_values: list | np.ndarray = np.array([0, 1000]),
         n_dims: int | None = 3,
         **kwargs,
     ):
-        self.options = kwargs
+        self.options = {**self.default_options, **kwargs}
         self.b_values = b_values
         self.n_dims = n_dims
         self.vectors = None
@@ -90,17 +94,24 @@ class FreeDiffusionTool:
     def write(
         self, filename: Path, header: list, diffusion_vectors: list | np.ndarray
     ) -> None:
-        with filename.open("w") as file:
-            # write header to file
-            for line in header:
-                file.write(line + self.options.get("newline", "\n"))
-
-            # write values to file
-            for row_idx, row in enumerate(diffusion_vectors):
-                file.write(
-                    self.vector_to_string(row_idx, row)
-                    + self.options.get("newline", "\n")
-                )
+        """
+        Write header and vectors to file.
+
+        The file is written as UTF-8 bytes and lines are separated by the "newline"
+        option as given, without translation to the platform line ending.
+        """
+        vectors = np.ascontiguousarray(diffusion_vectors, dtype=np.float64)
+        newline = self.options["newline"].encode()
+        # join header and values so the file is written in a single call,
+        # the trailing empty line adds the final newline without copying
+        body = newline.join(
+            chain(
+                (line.encode() for line in header),
+                self.vectors_to_bytes(vectors),
+                (b"",),
+            )
+        )
+        filename.write_bytes(body)
 
     def save(self, filename: Path) -> None:
         # get Header
@@ -1,4 +1,6 @@
-from datetime import datetime
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -6,7 +8,35 @@ import numpy as np
 from .free_diffusion_tools import FreeDiffusionTool
 
 
+@lru_cache(maxsize=1)
+def _format_timestamp(seconds: int) -> str:
+    """Header timestamp, cached so headers built within the same second reuse it."""
+    return time.strftime("%a %b %d %H:%M:%S %Y", time.localtime(seconds))
+
+
+@lru_cache(maxsize=None)
+def make_vector_to_bytes(decimals: int = 6):
+    """Return an encoded Siemens style vector formatter taking (index, x, y, z)."""
+    return (
+        f"Vector[%d] = (% .{decimals}f,% .{decimals}f,% .{decimals}f)".encode().__mod__
+    )
+
+
+SEPARATOR = (
+    r"# -----------------------------------------------------------------------------"
+)
+
+
 class BasicSiemensTool(FreeDiffusionTool):
+    default_options = {
+        **FreeDiffusionTool.default_options,
+        "default_path": r"C:\\Medcom\\MriCustomer\\seq\\DiffusionVectorSets\\",
+        "description": "Vector file for Siemens 'free' diffusion mode.",
+        "Comment": None,
+        "CoordinateSystem": "xyz",
+        "Normalisation": "none",
+    }
+
     def __init__(
         self,
         b_values: list | np.ndarray = np.array([0, 1000]),
@@ -59,50 +89,29 @@ class BasicSiemensTool(FreeDiffusionTool):
         kwargs: dict
             Options are explained in parent method documentation.
         """
-        # This is the total number of applied dimensions
-        n_directions = len(self.b_values) * self.n_dims
-
-        head = list()
-        head.append(
-            r"# -----------------------------------------------------------------------------"
-        )
-
-        if filename is not None:
-            if not isinstance(filename, Path):
-                filename = Path(filename)
-            filename = filename.name
-        else:
-            filename = "MyVectorSet.dvs"
-        default_path = self.options.get(
-            "default_path", r"C:\\Medcom\\MriCustomer\\seq\\DiffusionVectorSets\\"
-        )
-        head.append("# File: " + default_path + filename)
-
-        now = datetime.now()
-        current_time = now.strftime("%a %b %d %H:%M:%S %Y")
-        head.append(f"# Date: {current_time}")
+        opts = self.options
 
-        description = self.options.get(
-            "description", "Vector file for Siemens 'free' diffusion mode."
+        filename = (
+            os.path.basename(os.fspath(filename))
+            if filename is not None
+            else "MyVectorSet.dvs"
         )
-        head.append(f"# Description: {description}")
-        head.append(f"# b-values: {self.b_values}")
-        head.append(f"# number dimensions: {self.n_dims}")
-        comment = self.options.get("Comment", None)
-        if comment:
-            head.append(f"Comment: {comment}")
-
-        head.append(
-            r"# -----------------------------------------------------------------------------"
-        )
-        # Calculate the correct number of directions
-        head.append(f"[directions={n_directions}]")
-
-        coordinate_system = self.options.get("CoordinateSystem", "xyz")
-        head.append(f"CoordinateSystem = {coordinate_system}")
 
-        normalisation = self.options.get("Normalisation", "none")
-        head.append(f"Normalisation = {normalisation}")
+        comment = opts["Comment"]
+        head = [
+            SEPARATOR,
+            "# File: " + opts["default_path"] + filename,
+            f"# Date: {_format_timestamp(int(time.time()))}",
+            f"# Description: {opts['description']}",
+            f"# b-values: {self.b_values}",
+            f"# number dimensions: {self.n_dims}",
+            *([f"Comment: {comment}"] if comment else []),
+            SEPARATOR,
+            # Calculate the correct number of directions
+            f"[directions={len(self.b_values) * self.n_dims}]",
+            f"CoordinateSystem = {opts['CoordinateSystem']}",
+            f"Normalisation = {opts['Normalisation']}",
+        ]
         # NOTE: There is an option to add a comment here. "comment = example text"
         return head
 
@@ -129,6 +138,7 @@ class BasicSiemensTool(FreeDiffusionTool):
                 Comment: str
                     Further information and comments about the diffusion vector file.
                 Newline: str = "\n", "\r\n" for legacy
+                    Written as given, also on Windows (no "\r\n" translation).
 
         """
         header = self.construct_header(filename=filename)
@@ -143,11 +153,31 @@ class BasicSiemensTool(FreeDiffusionTool):
         index: int, vector: np.ndarray | list, decimals: int = 6
     ) -> str:
         """Siemens style vector conversion."""
-        return (
-            f"Vector[{index}] = ("
-            f"{vector[0]: .{decimals}f},"
-            f"{vector[1]: .{decimals}f},"
-            f"{vector[2]: .{decimals}f})"
+        fmt = f" .{decimals}f"
+        return "".join(
+            (
+                "Vector[",
+                str(index),
+                "] = (",
+                format(vector[0], fmt),
+                ",",
+                format(vector[1], fmt),
+                ",",
+                format(vector[2], fmt),
+                ")",
+            )
+        )
+
+    @staticmethod
+    def vectors_to_bytes(vectors: np.ndarray | list, decimals: int = 6) -> list:
+        """Siemens style conversion of all vectors straight to encoded lines."""
+        # tolist() converts all values to floats in one C pass, avoiding numpy
+        # scalar boxing on every element access (faster than np.char.mod here)
+        vectors = np.asarray(vectors, dtype=np.float64)
+        # only x, y and z are written, further columns are ignored
+        columns = vectors.T.tolist()[:3]
+        return list(
+            map(make_vector_to_bytes(decimals), zip(range(len(vectors)), *columns))
         )
 
     def load(self, filename: Path) -> None:
@@ -167,22 +197,28 @@ class BasicSiemensTool(FreeDiffusionTool):
             vector = [np.float64(i) for i in vector]
             return position, vector
 
+        # bind once instead of resolving the method for every vector line
+        append = vector_list.append
         with filename.open("r") as file:
             for line in file:
 
                 # Read data
                 if not line.startswith("#"):
                     if line.startswith("Vector"):
-                        vector_list.append(process_vector_line(line)[1])
+                        append(process_vector_line(line)[1])
 
         self.vectors = np.array(vector_list)
 
 
 class LegacySiemensTool(BasicSiemensTool):
+    default_options = {
+        **BasicSiemensTool.default_options,
+        "newline": "\r\n",
+        "default_path": r"C:\\Medcom\\MriCustomer\\seq\\",
+    }
+
     def __init__(self, b_values: list | np.ndarray, n_dims: int, **kwargs):
         super().__init__(b_values, n_dims, **kwargs)
-        self.options["newline"] = "\r\n"
-        self.options["default_path"] = r"C:\\Medcom\\MriCustomer\\seq\\"
 
     def save(self, filename: Path = Path("DiffusionVectors.txt"), **options: dict):
         """
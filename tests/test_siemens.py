@@ -82,3 +82,102 @@ def test_legacy_save(
 ):
     free_diffusion_tool_siemens_legacy.save(vector_filename_siemens_legacy)
     assert vector_filename_siemens_legacy.is_file()
+
+
+def test_vectors_to_bytes(free_diffusion_tool_siemens_basic):
+    vectors = free_diffusion_tool_siemens_basic.get_diffusion_vectors()
+    lines = free_diffusion_tool_siemens_basic.vectors_to_bytes(vectors)
+    assert lines == [
+        BasicSiemensTool.vector_to_string(idx, row).encode()
+        for idx, row in enumerate(vectors)
+    ]
+
+
+def test_legacy_default_options():
+    tool = LegacySiemensTool([0, 1000], 3, Comment="test")
+    assert tool.options["newline"] == "\r\n"
+    assert tool.options["default_path"] == r"C:\\Medcom\\MriCustomer\\seq\\"
+    assert tool.options["Comment"] == "test"
+
+
+def test_basic_save_empty(vector_filename_siemens_basic):
+    BasicSiemensTool([], 3).save(vector_filename_siemens_basic)
+    lines = vector_filename_siemens_basic.read_bytes().split(b"\n")
+    assert b"[directions=0]" in lines
+    assert not any(line.startswith(b"Vector") for line in lines)
+
+    BasicSiemensTool().write(vector_filename_siemens_basic, ["h"], [])
+    assert vector_filename_siemens_basic.read_bytes() == b"h\n"
+
+
+def test_vectors_to_bytes_extra_columns():
+    vectors = np.arange(8, dtype=float).reshape(2, 4)
+    assert BasicSiemensTool.vectors_to_bytes(vectors) == [
+        BasicSiemensTool.vector_to_string(idx, row).encode()
+        for idx, row in enumerate(vectors)
+    ]
+
+
+def test_basic_save_unhashable_comment(vector_filename_siemens_basic):
+    BasicSiemensTool([0, 1000], 3, Comment=["a"]).save(vector_filename_siemens_basic)
+    assert b"Comment: ['a']" in vector_filename_siemens_basic.read_bytes()
+
+
+SEPARATOR_LINE = (
+    b"# -----------------------------------------------------------------------------"
+)
+VECTOR_LINES = [
+    b"Vector[0] = ( 0.000000, 0.000000, 0.000000)",
+    b"Vector[1] = ( 0.000000, 0.000000, 0.000000)",
+    b"Vector[2] = ( 0.000000, 0.000000, 0.000000)",
+    b"Vector[3] = ( 1.000000, 0.000000, 0.000000)",
+    b"Vector[4] = ( 0.000000, 1.000000, 0.000000)",
+    b"Vector[5] = ( 0.000000, 0.000000, 1.000000)",
+]
+
+
+def read_masked(filename: Path, newline: bytes) -> list:
+    """Read written lines with the Date line masked and check the line ending."""
+    data = filename.read_bytes()
+    assert data.endswith(newline) and not data.endswith(newline * 2)
+    lines = data[: -len(newline)].split(newline)
+    assert lines[2].startswith(b"# Date: ")
+    lines[2] = b"# Date:"
+    return lines
+
+
+def test_basic_save_content(vector_filename_siemens_basic):
+    tool = BasicSiemensTool([0, 1000], 3, description="b \u00b5", Comment="test")
+    tool.save(vector_filename_siemens_basic)
+    assert b"\r" not in vector_filename_siemens_basic.read_bytes()
+    assert read_masked(vector_filename_siemens_basic, b"\n") == [
+        SEPARATOR_LINE,
+        rb"# File: C:\\Medcom\\MriCustomer\\seq\\DiffusionVectorSets\\test_DiffVector.dvs",
+        b"# Date:",
+        "# Description: b \u00b5".encode("utf-8"),
+        b"# b-values: [0, 1000]",
+        b"# number dimensions: 3",
+        b"Comment: test",
+        SEPARATOR_LINE,
+        b"[directions=6]",
+        b"CoordinateSystem = xyz",
+        b"Normalisation = none",
+        *VECTOR_LINES,
+    ]
+
+
+def test_legacy_save_content(vector_filename_siemens_legacy):
+    LegacySiemensTool([0, 1000], 3).save(vector_filename_siemens_legacy)
+    assert read_masked(vector_filename_siemens_legacy, b"\r\n") == [
+        SEPARATOR_LINE,
+        rb"# File: C:\\Medcom\\MriCustomer\\seq\\DiffusionVectors.txt",
+        b"# Date:",
+        b"# Description: Vector file for Siemens 'free' diffusion mode.",
+        b"# b-values: [0, 1000]",
+        b"# number dimensions: 3",
+        SEPARATOR_LINE,
+        b"6]",
+        b"CoordinateSystem = xyz",
+        b"Normalisation = none",
+        *VECTOR_LINES,
+    ]